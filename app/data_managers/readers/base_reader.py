@@ -1,15 +1,21 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Optional, Union
 
 import pandas as pd
+import pyarrow as pa
+from pandas.api.types import infer_dtype
+from pyarrow import csv as pacsv
 
 from ..namespaces import data_ns
-from ..utils import SourceMetaData
+from ..utils import get_source_metadata
 from ..utils.data_checker import check_data
 from .scraping.base_scraper import BaseScraper
 
 SOURCE = Union[str, list, Path]
+# arrow-backed strings keep contiguous utf-8 buffers instead of python objects
+STRING_DTYPE = pd.StringDtype("pyarrow")
 
 
 class BaseReader(ABC):
@@ -17,6 +23,10 @@ class BaseReader(ABC):
 
     DATE_FORMAT = "%Y-%m-%d %H"
     _READ_KWARGS = {}
+    # columns used by _format, besides the ones defined in source namespace
+    _FORMAT_COLUMNS: list[str] = []
+    # maximum number of source files parsed concurrently
+    _MAX_WORKERS = 8
 
     def __init__(self, source: str) -> None:
         """
@@ -24,7 +34,14 @@ class BaseReader(ABC):
             source (str): data source name
         """
         # gets source metadata from sources_ns.py
-        self._meta = SourceMetaData(source=source)
+        self._meta = get_source_metadata(source)
+        # columns of formatted DataFrame in the order of namespace
+        self._valid_cols = [data_ns.TIME, *self._meta.numeric_cols]
+        self._numeric_set = frozenset(self._meta.numeric_cols)
+        # columns (after renaming) used by the formatting steps
+        self._used_cols = frozenset(
+            (*self._valid_cols, *self._meta.renames.values(), *self._FORMAT_COLUMNS)
+        )
         super().__init__()
 
     def _format(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -39,6 +56,9 @@ class BaseReader(ABC):
     def read(self, source: SOURCE) -> pd.DataFrame:
         """Reads and formats input data
 
+        DataFrame read from the source is owned by the pipeline,
+        so formatting steps modify it in place instead of copying.
+
         Args:
             source: list or pathlike
                 List of strings or Path objects with input data.
@@ -48,7 +68,6 @@ class BaseReader(ABC):
             pd.DataFrame: Formatted DataFrame
         """
         df = self._read(source=source)
-        df = self._rename_columns(df)
         df = self._cast_to_str(df)
         df = self._format(df)
         df = self._drop_redundant_columns(df)
@@ -58,50 +77,162 @@ class BaseReader(ABC):
         return df
 
     def _read(self, source: SOURCE) -> pd.DataFrame:
+        """
+        Reads input data files chunk by chunk, renames and prunes columns
+        of each chunk, so redundant raw columns of all files are never
+        held in memory at once. Files are parsed in concurrent threads,
+        parsers release GIL for most of the work.
+        """
         if not isinstance(source, list):
             source = [source]
-        df = pd.concat((self._read_source(file) for file in source), ignore_index=True)
+        workers = min(self._MAX_WORKERS, len(source))
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            files = list(executor.map(self._read_file, source))
+        chunks = [chunk for file in files for chunk in file]
+        df = pd.concat(chunks, ignore_index=True, copy=False)
         return df
 
-    def _cast_to_str(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Assign object type to every column that is not specified as numeric"""
-        df = data.copy()
-        non_num = list(filter(lambda x: x not in self._meta.numeric_cols, df.columns))
-        df[non_num] = df[non_num].astype(str)
-        return df
+    def _read_file(self, source: Union[str, Path]) -> list[pd.DataFrame]:
+        """Reads input data file into renamed and pruned chunks"""
+        return [self._project_columns(chunk) for chunk in self._read_chunks(source)]
 
-    def _rename_columns(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Renames columns names using source specific rename dict"""
-        df = data.copy()
-        df = df.rename(self._meta.renames, axis=1)
-        return df
+    def _read_chunks(self, source: Union[str, Path]) -> Iterator[pd.DataFrame]:
+        """Yields raw DataFrame chunks of input data file"""
+        yield self._read_source(source)
+
+    def _project_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Renames columns and drops the ones that are not used by any
+        of the following steps, in a single selection
+        """
+        renames = self._meta.renames
+        used = [col for col in data.columns if renames.get(col, col) in self._used_cols]
+        return data[used].rename(columns=renames, copy=False)
+
+    def _cast_to_str(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Assign arrow-backed string type to every column that is not specified
+        as numeric. Columns already parsed as strings are not copied.
+        """
+        to_cast = [
+            col
+            for col in data.columns
+            if col not in self._numeric_set and infer_dtype(data[col]) != "string"
+        ]
+        data[to_cast] = data[to_cast].astype(STRING_DTYPE)
+        return data
 
     def _drop_redundant_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """Drops redundant columns that are not numeric, id or time"""
-        df = data.copy()
-        valid = [data_ns.TIME] + self._meta.numeric_cols
-        redundant = filter(lambda x: x not in valid, df.columns)
-        df = df.drop(redundant, axis=1)
+        redundant = [col for col in data.columns if col not in self._meta.valid_cols]
+        data.drop(columns=redundant, inplace=True)
         # set order of columns as in namespace
-        df = df.reindex(columns=valid)
-        return df
+        return data.reindex(columns=self._valid_cols, copy=False)
 
     def _set_time_index(self, data: pd.DataFrame) -> pd.DataFrame:
         """Sets time columns as DataFrame index"""
-        df = data.copy()
-        df[data_ns.TIME] = pd.to_datetime(df[data_ns.TIME], format=self.DATE_FORMAT)
-        df = df.set_index(data_ns.TIME).sort_index()
-        return df
+        data[data_ns.TIME] = self._parse_time(data[data_ns.TIME])
+        return data.set_index(data_ns.TIME).sort_index()
+
+    def _parse_time(self, time: pd.Series) -> pd.DatetimeIndex:
+        """
+        Parses time column, each unique entry is parsed only once
+        and broadcasted back, as entries repeat across source files
+        """
+        codes, uniques = pd.factorize(time.to_numpy(), use_na_sentinel=False)
+        parsed = pd.to_datetime(uniques, format=self.DATE_FORMAT)
+        return parsed[codes]
 
     def _drop_duplicated_index(self, data: pd.DataFrame) -> pd.DataFrame:
-        return data.groupby(level=0).last()
+        """Drops entries with duplicated time, keeping the last one"""
+        if data.index.is_unique:
+            return data
+        return data.loc[~data.index.duplicated(keep="last")]
 
 
 class CSVReader(BaseReader):
     """Abstract class for reading csv files"""
 
+    ENCODING = "windows-1252"
+    # arrow type of numeric source columns, fixed for all streamed blocks
+    NUMERIC_TYPE = pa.float64()
+
     def _read_source(self, source: str) -> pd.DataFrame:
-        return pd.read_csv(source, encoding="windows-1252", **self._READ_KWARGS)
+        """Reads csv file with multithreaded pyarrow parser"""
+        table = pacsv.read_csv(source, **self._get_arrow_options())
+        return table.to_pandas(types_mapper=self._types_mapper)
+
+    def _read_chunks(self, source: Union[str, Path]) -> Iterator[pd.DataFrame]:
+        """
+        Streams csv file in blocks, so only one raw block is in memory.
+        Unused columns are skipped by the parser. If numeric columns contain
+        values that are not numbers, file is read again with them as text,
+        the same as pandas reads them as objects.
+        """
+        try:
+            chunks = list(self._stream_chunks(source, self.NUMERIC_TYPE))
+        except pa.ArrowInvalid:
+            chunks = list(self._stream_chunks(source, pa.string()))
+        return iter(chunks)
+
+    def _stream_chunks(
+        self, source: Union[str, Path], numeric_type: pa.DataType
+    ) -> Iterator[pd.DataFrame]:
+        """Yields DataFrame of each streamed block of csv file"""
+        options = self._get_arrow_options(numeric_type)
+        header = pd.read_csv(
+            source,
+            sep=options["parse_options"].delimiter,
+            encoding=self.ENCODING,
+            nrows=0,
+        ).columns
+        renames = self._meta.renames
+        include = [col for col in header if renames.get(col, col) in self._used_cols]
+        options["convert_options"].include_columns = include
+        reader = pacsv.open_csv(source, **options)
+        for batch in reader:
+            yield batch.to_pandas(types_mapper=self._types_mapper)
+
+    @staticmethod
+    def _types_mapper(
+        arrow_type: pa.DataType,
+    ) -> Optional[pd.api.extensions.ExtensionDtype]:
+        """Maps arrow string columns to arrow-backed pandas strings, zero-copy"""
+        return STRING_DTYPE if arrow_type == pa.string() else None
+
+    def _get_arrow_options(self, numeric_type: Optional[pa.DataType] = None) -> dict:
+        """
+        Translates pandas-like read kwargs into pyarrow csv options,
+        numeric source columns are read as numeric_type, NUMERIC_TYPE by default
+        """
+        kwargs = self._READ_KWARGS
+        read_opts = pacsv.ReadOptions(encoding=self.ENCODING)
+        parse_opts = pacsv.ParseOptions(delimiter=kwargs.get("sep", ","))
+        # na values extend default ones, the same as in pd.read_csv
+        null_values = pacsv.ConvertOptions().null_values + kwargs.get("na_values", [])
+        # streamed types would be inferred from the first block only,
+        # so types of all used source columns are fixed upfront
+        source_names = {name: col for col, name in self._meta.renames.items()}
+        column_types = {
+            col: pa.string()
+            for col, name in self._meta.renames.items()
+            if name not in self._meta.numeric_cols
+        }
+        for name in self._meta.numeric_cols:
+            column_types[source_names.get(name, name)] = (
+                numeric_type or self.NUMERIC_TYPE
+            )
+        convert_opts = pacsv.ConvertOptions(
+            column_types=column_types,
+            decimal_point=kwargs.get("decimal", "."),
+            null_values=null_values,
+            strings_can_be_null=True,
+        )
+        return {
+            "read_options": read_opts,
+            "parse_options": parse_opts,
+            "convert_options": convert_opts,
+        }
 
 
 class ExcelReader(BaseReader):
@@ -114,6 +245,9 @@ class ExcelReader(BaseReader):
 class WebScraper(BaseReader):
     """Abstract class for scraping data from Web"""
 
+    # driver session is shared, pages are scraped one by one
+    _MAX_WORKERS = 1
+
     def __init__(self, source: str, scraper: BaseScraper) -> None:
         super().__init__(source)
         self._scraper = scraper
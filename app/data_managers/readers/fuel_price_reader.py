@@ -1,3 +1,5 @@
+from io import StringIO
+
 import pandas as pd
 
 from .base_reader import SOURCE, WebScraper
@@ -12,6 +14,7 @@ class FuelPricesReader(WebScraper):
         return super().read(source)
 
     def _read_source(self, source: str) -> pd.DataFrame:
-        html = self._scraper.get_source(source)
-        df = pd.read_html(html.prettify(), **self._READ_KWARGS)[0]  # type: ignore
+        # raw html is passed straight to lxml, without BeautifulSoup round trip
+        html = self._scraper.get_html(source)
+        df = pd.read_html(StringIO(html), **self._READ_KWARGS)[0]
         return df
@@ -1,6 +1,6 @@
-from datetime import timedelta
-
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_float_dtype
 
 from ..namespaces import data_ns
 from .base_reader import CSVReader, ExcelReader
@@ -17,9 +17,15 @@ class PSEReader(CSVReader):
     def _format(self, data: pd.DataFrame) -> pd.DataFrame:
         df = data.copy()
         df = self._add_time_column(data=df)
-        # df = self._format_numeric_columns(data=df)
+        df = self._downcast_numeric_columns(data=df)
         return df
 
+    def _downcast_numeric_columns(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Casts float numeric columns to single precision, prices and demand fit"""
+        cols = [col for col in self._meta.numeric_cols if is_float_dtype(data[col])]
+        data[cols] = data[cols].astype(np.float32)
+        return data
+
     def _add_time_column(self, data: pd.DataFrame) -> pd.DataFrame:
         """Adds new datetime column with entry time to DataFrame"""
         df = data.copy()
@@ -31,7 +37,7 @@ class PSEReader(CSVReader):
         df = self._unify_hour_format(data=df)
         # creates datetime pd.Series with entry times
         time = pd.to_datetime(
-            df[[self.DATE_COLUMN, self.HOUR_COLUMN]].agg(" ".join, axis=1),
+            df[self.DATE_COLUMN].str.cat(df[self.HOUR_COLUMN], sep=" "),
             format=self.DATE_FORMAT,
         )
         # shifts midnight entries day to the following one
@@ -46,10 +52,9 @@ class PSEReader(CSVReader):
         The timezone is changed back to winter time (UTC+01:00) every year,
         2 AM hour is duplicated and marked 'A'.
         """
-        df = data.copy()
-        mask = df[self.HOUR_COLUMN].apply(lambda x: TIMEZONE_MARK in str(x))
-        df = df.drop(index=df[mask].index)
-        return df
+        hours = data[self.HOUR_COLUMN]
+        mask = hours.str.contains(TIMEZONE_MARK, regex=False, na=False)
+        return data.drop(index=data.index[mask])
 
     def _replace_midnight_entries(self, data: pd.DataFrame) -> pd.DataFrame:
         """Replaces midnight hours that are marked as 24 with 0 hour"""
@@ -64,18 +69,14 @@ class PSEReader(CSVReader):
         This operation is done, because midnight hour is marked as 24 in
         input data and was replaced with 0, one day must be added.
         """
-        time = time.copy()
         mask = time.dt.hour == 0
-        time.loc[mask] = time.loc[mask].apply(lambda x: x + timedelta(days=1))
+        time.loc[mask] += pd.Timedelta(days=1)
         return time
 
     def _unify_hour_format(self, data: pd.DataFrame) -> pd.DataFrame:
         """Unifies hour format to two digits, hours between 0 and 9 starting with 0"""
-        df = data.copy()
-        df[self.HOUR_COLUMN] = df[self.HOUR_COLUMN].apply(
-            lambda x: x if len(x) > 1 else f"0{x}"
-        )
-        return df
+        data[self.HOUR_COLUMN] = data[self.HOUR_COLUMN].str.zfill(2)
+        return data
 
 
 class CO2Reader(ExcelReader):
@@ -1,2 +1,3 @@
 from .base_scraper import BaseScraper
 from .driver_factory import DriverFactory
+from .driver_pool import DriverPool
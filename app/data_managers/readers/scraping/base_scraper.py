@@ -15,6 +15,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 
 from ...namespaces import scraper_ns
 from .driver_factory import DriverFactory
+from .driver_pool import DriverPool
 from .tag_extractor import TagExtractor
 
 
@@ -26,6 +27,7 @@ class BaseScraper(TagExtractor):
         wait_time: int = 5,
         verbose: bool = True,
         load_time: float = 0.1,
+        pool: Optional[DriverPool] = None,
     ) -> None:
         """
         Initialize selenium.webdriver.Chrome object
@@ -41,11 +43,19 @@ class BaseScraper(TagExtractor):
                 If True additional printouts will be added
             load_time: float, default 0.1
                 Seconds to wait after directing to page
+            pool: DriverPool, optional
+                Pool of driver sessions, if specified browser session is
+                taken from it and returned to it on quit instead of closing
         """
         self._load_sleep = load_time
         self._wait_time = wait_time
-        self._factory = DriverFactory(path=driver, headless=headless, verbose=verbose)
-        self._driver = self._factory.get()
+        self._pool = pool
+        if pool is None:
+            factory = DriverFactory(path=driver, headless=headless, verbose=verbose)
+            self._driver = factory.get()
+        else:
+            self._driver = pool.acquire()
+        self._waiter = WebDriverWait(driver=self._driver, timeout=self._wait_time)
 
     @property
     def current_url(self) -> str:
@@ -69,22 +79,38 @@ class BaseScraper(TagExtractor):
             end_session: bool, deafult = True
                 If false browser session is not closed
         """
+        raw_html = self.get_html(link=link, end_session=end_session)
+        return self._to_bs(raw_html, parser)
+
+    def get_html(self, link: str, end_session: bool = True) -> str:
+        """
+        Execute driver.get method, loads a webpage in a current
+        browser session and returns raw body html, without parsing it
+
+        Parameters:
+            link : str
+                link to webpage
+            end_session: bool, deafult = True
+                If false browser session is not closed
+        """
         try:
             self._driver.get(link)
         except InvalidArgumentException:
             print("GET REQUEST FAILED - INVALID PAGE")
             self.quit()
+            raise
         except AttributeError:
             print("AttributeError - probably tag was not found")
             self.quit()
+            raise
 
         self._accept_privacy()
         # wait for page to load
         time.sleep(self._load_sleep)
-        parsed_markup = self._get_markup(parser=parser)
+        raw_html = self._driver_get_body()
         if end_session:
             self.quit()
-        return parsed_markup
+        return raw_html
 
     def _get_markup(
         self,
@@ -142,10 +168,9 @@ class BaseScraper(TagExtractor):
             selector = self._tag_to_selector(tag_dict=selector)
         if wait:
             try:
-                # TODO: check for speed
-                elements = WebDriverWait(
-                    driver=self._driver, timeout=self._wait_time
-                ).until(EC.visibility_of_any_elements_located((by, selector)))
+                elements = self._waiter.until(
+                    EC.visibility_of_any_elements_located((by, selector))
+                )
 
             except InvalidSelectorException as e:
                 print("INVALID CSS SELECTOR")
@@ -202,8 +227,18 @@ class BaseScraper(TagExtractor):
         self._driver.execute_script("arguments[0].click();", element)
 
     def quit(self) -> None:
-        """Quits driver session using driver.quit method"""
-        self._driver.quit()
+        """
+        Quits driver session using driver.quit method,
+        pooled session is returned to the pool instead,
+        session is ended only once even if quit is called again
+        """
+        if self._driver is None:
+            return
+        if self._pool is not None:
+            self._pool.release(self._driver)
+        else:
+            self._driver.quit()
+        self._driver = None
 
     def close(self) -> None:
         """Closes current page using driver.close method"""
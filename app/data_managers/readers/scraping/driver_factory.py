@@ -1,18 +1,39 @@
 import warnings
+from threading import Lock
 from typing import Optional
 
 from selenium.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.remote.webdriver import WebDriver
-from webdriver_manager.chrome import ChromeDriverManager
 
 DRIVER_VERSION = "driver_version"
 BROWSER_VERSION = "browser_version"
+# days for which downloaded driver is considered up to date
+DRIVER_CACHE_DAYS = 7
+# 512 MB of browser disk cache
+DISK_CACHE_SIZE = 512 * 1024 * 1024
+# scrapers read only DOM, so browser work unrelated to it is disabled
+BROWSER_ARGUMENTS = ["--disable-gpu", "--disable-extensions", "--disable-dev-shm-usage"]
+BLOCKED_CONTENT = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
 
 
 class DriverFactory:
+    # driver executable resolved by ChromeDriverManager, shared by all factories
+    _cached_driver_path: Optional[str] = None
+    _driver_path_lock = Lock()
+    # driver executables already checked for compatibility with browser
+    _checked_driver_paths: set[str] = set()
+
     def __init__(
-        self, path: Optional[str] = None, headless: bool = True, verbose: bool = True
+        self,
+        path: Optional[str] = None,
+        headless: bool = True,
+        verbose: bool = True,
+        profile_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
         """Initializes DriverFactory
 
@@ -25,22 +46,34 @@ class DriverFactory:
             verbose: bool, optional
                 If verbose is set to True, additional information will be printed out.
                 Defaults to True.
+            profile_dir: str, optional
+                Chrome user data directory, reused between sessions to keep
+                browser cache. Defaults to None, temporary profile is used.
+                Directory can be used by one running session at a time.
+            cache_dir: str, optional
+                Directory of persistent HTTP disk cache. Defaults to None,
+                cache of browser profile is used.
         """
         self.path = path
         self.headless = headless
         self.verbose = verbose
+        self.profile_dir = profile_dir
+        self.cache_dir = cache_dir
 
     def get(self) -> WebDriver:
         """
         Initialize selenium.webdriver.Chrome object and checks
-        its compatibility with chrome version
+        its compatibility with chrome version (once per driver executable)
 
         Returns:
             Webdriver: selenium.webdriver.Chrome
         """
         opts = self._get_options()
         driver = self._get_driver(options=opts)
-        self._check_compatibility(driver=driver)
+        # browser and driver do not change within process, checked once per driver
+        if self.path not in self._checked_driver_paths:
+            self._check_compatibility(driver=driver)
+            self._checked_driver_paths.add(self.path)  # type: ignore
         return driver
 
     def _check_compatibility(self, driver: WebDriver) -> None:
@@ -54,8 +87,8 @@ class DriverFactory:
         """
         # check compatibility with chrome browser
         details = self._get_details(driver)
-        browser_version = details[BROWSER_VERSION].split(".")[0]
-        driver_version = details[DRIVER_VERSION].split(".")[0]
+        browser_version = details[BROWSER_VERSION].split(".", 1)[0]
+        driver_version = details[DRIVER_VERSION].split(".", 1)[0]
         if browser_version != driver_version:
             warnings.warn(
                 "Browser's version might be incompatible with driver's version"
@@ -76,12 +109,13 @@ class DriverFactory:
         Returns:
             dict: driver and browser version information
         """
-        browser_name = driver.capabilities["browserName"]
-        browser_version = driver.capabilities["browserVersion"]
-        driver_version = driver.capabilities[browser_name][
-            f"{browser_name}driverVersion"
-        ].split(" ")[0]
-        details = {DRIVER_VERSION: driver_version, BROWSER_VERSION: browser_version}
+        caps = driver.capabilities
+        browser_name = caps["browserName"]
+        driver_version = caps[browser_name][f"{browser_name}driverVersion"]
+        details = {
+            DRIVER_VERSION: driver_version.split(" ", 1)[0],
+            BROWSER_VERSION: caps["browserVersion"],
+        }
         return details
 
     def _get_options(self) -> Options:
@@ -100,6 +134,15 @@ class DriverFactory:
         opts.add_experimental_option(
             "excludeSwitches", ["enable-logging", "disable-popup-blocking"]
         )
+        # images and notifications are never loaded
+        opts.add_experimental_option("prefs", BLOCKED_CONTENT)
+        for argument in BROWSER_ARGUMENTS:
+            opts.add_argument(argument)
+        if self.profile_dir is not None:
+            opts.add_argument(f"--user-data-dir={self.profile_dir}")
+        if self.cache_dir is not None:
+            opts.add_argument(f"--disk-cache-dir={self.cache_dir}")
+            opts.add_argument(f"--disk-cache-size={DISK_CACHE_SIZE}")
         return opts
 
     def _get_driver(self, options: Options) -> WebDriver:
@@ -115,10 +158,25 @@ class DriverFactory:
             Webdriver: selenium.webdriver.Chrome
         """
         if self.path is None:
-            # download latest driver
-            self.path = ChromeDriverManager().install()
+            self.path = self._resolve_driver_path()
 
         if self.verbose:
             print(f"driver: {self.path}")
 
         return Chrome(executable_path=self.path, options=options)
+
+    @classmethod
+    def _resolve_driver_path(cls) -> str:
+        """
+        Returns path to the latest driver, downloaded at most once per process.
+        Lock keeps concurrent factories from installing the driver at once.
+        """
+        with cls._driver_path_lock:
+            if cls._cached_driver_path is None:
+                # imported only when driver has to be downloaded
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                # download latest driver
+                manager = ChromeDriverManager(cache_valid_range=DRIVER_CACHE_DAYS)
+                cls._cached_driver_path = manager.install()
+            return cls._cached_driver_path
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .driver_factory import DriverFactory
+
+BLANK_PAGE = "about:blank"
+
+
+class DriverPool:
+    """
+    Keeps idle webdriver sessions for reuse,
+    so browser process is not started for every scraper
+    """
+
+    def __init__(self, factory: DriverFactory, size: int = 1) -> None:
+        """
+        Args:
+            factory: DriverFactory
+                Factory creating new driver sessions when pool is empty
+            size: int, optional
+                Maximum number of idle sessions kept in the pool. Defaults to 1.
+        """
+        self._factory = factory
+        self._size = size
+        self._idle: list[WebDriver] = []
+        self._lock = Lock()
+
+    def acquire(self) -> WebDriver:
+        """Returns idle driver session from the pool or creates a new one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._factory.get()
+
+    def release(self, driver: WebDriver) -> None:
+        """
+        Resets driver session and returns it to the pool,
+        session is quit if it is broken or pool is full,
+        driver already idle in the pool is not added again
+        """
+        with self._lock:
+            if any(driver is idle for idle in self._idle):
+                return
+        try:
+            driver.delete_all_cookies()
+            driver.get(BLANK_PAGE)
+        except WebDriverException:
+            driver.quit()
+            return
+        with self._lock:
+            if len(self._idle) < self._size:
+                self._idle.append(driver)
+                return
+        driver.quit()
+
+    def scrape_many(
+        self, urls: list[str], max_workers: Optional[int] = None
+    ) -> list[str]:
+        """
+        Loads pages concurrently and returns their sources in order of urls.
+        Each worker thread uses its own driver session, threads wait
+        for driver IPC most of the time, so GIL does not limit them.
+
+        Args:
+            urls: list[str]
+                Links to webpages
+            max_workers: int, optional
+                Number of pages loaded at once. Defaults to pool size.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or self._size) as executor:
+            return list(executor.map(self._get_page_source, urls))
+
+    def _get_page_source(self, url: str) -> str:
+        """Loads page with pooled driver session and returns its source"""
+        driver = self.acquire()
+        try:
+            driver.get(url)
+            return driver.page_source
+        finally:
+            self.release(driver)
+
+    def close(self) -> None:
+        """Quits all idle driver sessions"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            driver.quit()
@@ -1,18 +1,64 @@
 import re
+from functools import lru_cache
 from typing import Any, Optional, Union
 
 from bs4 import BeautifulSoup as Bs
+from bs4 import SoupStrainer
 from bs4.element import ResultSet, Tag
 
 from ...namespaces import scraper_ns
 
+# tag name or attributes of the only tags to be parsed
+STRAIN = Optional[Union[str, dict]]
+
+
+def _get_strainer(strain: STRAIN) -> Optional[SoupStrainer]:
+    """Creates SoupStrainer from tag name or tag attributes"""
+    if strain is None:
+        return None
+    if isinstance(strain, str):
+        return SoupStrainer(name=strain)
+    return SoupStrainer(attrs=strain)
+
+
+def _freeze_attrs(tag_dict: dict) -> tuple[tuple[str, bool, str], ...]:
+    """Returns hashable (name, use_re, value) attributes of tag_dict"""
+    return tuple(
+        (key, bool(value["re"]), value["value"])
+        for key, value in tag_dict.items()
+        if key != "tag_name"
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_selector(tag_name: str, attrs: tuple[tuple[str, bool, str], ...]) -> str:
+    """Builds CSS selector once per tag shape"""
+    attr_selectors = (
+        f"[{key}{'*=' if use_re else '='}{value}]" for key, use_re, value in attrs
+    )
+    return tag_name + "".join(attr_selectors)
+
+
+@lru_cache(maxsize=1024)
+def _compile_attrs(attrs: tuple[tuple[str, bool, str], ...]) -> dict:
+    """Compiles tag attributes, regex patterns are compiled once per tag shape"""
+    return {key: re.compile(value) if use_re else value for key, use_re, value in attrs}
+
 
 class TagExtractor:
     """Base Interface for extracting elements from markup Tags"""
 
-    def _to_bs(self, raw_html: str, parser: str = scraper_ns.DEFAULT_PARSER) -> Tag:
-        """Creates BeautifulSoup object from raw html"""
-        parsed_markup = Bs(raw_html, parser)
+    def _to_bs(
+        self,
+        raw_html: str,
+        parser: str = scraper_ns.DEFAULT_PARSER,
+        strain: STRAIN = None,
+    ) -> Tag:
+        """
+        Creates BeautifulSoup object from raw html, if strain is specified
+        only matching tags are parsed, the rest of document is skipped
+        """
+        parsed_markup = Bs(raw_html, parser, parse_only=_get_strainer(strain))
         return parsed_markup
 
     def save_markup(self, markup: Tag, file_path: str) -> None:
@@ -21,11 +67,17 @@ class TagExtractor:
             file.write(str(markup))
 
     def read_bs_from_file(
-        self, path: str, parser: str = scraper_ns.DEFAULT_PARSER
+        self,
+        path: str,
+        parser: str = scraper_ns.DEFAULT_PARSER,
+        strain: STRAIN = None,
     ) -> Tag:
-        """Reads markup from the file and returns BeautifulSoup object"""
+        """
+        Reads markup from the file and returns BeautifulSoup object,
+        if strain is specified only matching tags are parsed
+        """
         with open(path, "r", encoding="utf8") as file:
-            parsed_markup = Bs(file, parser)
+            parsed_markup = Bs(file, parser, parse_only=_get_strainer(strain))
         return parsed_markup
 
     def _find(
@@ -56,13 +108,19 @@ class TagExtractor:
         tag = markup.find(name=tag_name, attrs=attrs)
         return tag
 
-    def _get_body_tag(self, markup: Tag) -> Any:
-        """Extracts body tag from markup"""
+    def _get_body_tag(self, markup: Union[Tag, str]) -> Any:
+        """
+        Extracts body tag from markup, raw html is parsed
+        only within body tag
+        """
+        if isinstance(markup, str):
+            markup = self._to_bs(markup, strain="body")
         body = markup.find("body")
         return body
 
     def _concat_resultset(self, resultset: ResultSet) -> Tag:
         """Concatenate ResultSet and returns one BeautifulSoup object"""
+        # lxml re-parses joined markup faster than bs4 copies the tag trees
         new_tag = "".join(str(tag) for tag in resultset)
         new_tag = Bs(new_tag, scraper_ns.DEFAULT_PARSER)
         return new_tag
@@ -87,15 +145,8 @@ class TagExtractor:
                 if False uses find method instead of find_all and
                 returns Tag, else ResultSet
         """
-        tag_name = tag_dict.pop("tag_name") if "tag_name" in tag_dict else None
-        tag_attrs = {}
-        for key, value in tag_dict.items():
-            use_re = value["re"]
-            if use_re:
-                attr_value = re.compile(value["value"])
-            else:
-                attr_value = value["value"]
-            tag_attrs[key] = attr_value
+        tag_name = tag_dict.get("tag_name")
+        tag_attrs = _compile_attrs(_freeze_attrs(tag_dict))
         tags = self._find(markup=markup, tag_name=tag_name, all=all, **tag_attrs)
         return tags
 
@@ -108,9 +159,5 @@ class TagExtractor:
                 description of the tag, containing information about its
                 attributes, check out tags namespaces
         """
-        tag_name = tag_dict.pop("tag_name") if "tag_name" in tag_dict else ""
-        selector = tag_name
-        for key, value in tag_dict.items():
-            operator = "*=" if value["re"] else "="
-            selector += f"[{key}{operator}{value['value']}]"
-        return selector
+        tag_name = tag_dict.get("tag_name", "")
+        return _build_selector(tag_name, _freeze_attrs(tag_dict))
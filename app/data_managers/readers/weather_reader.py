@@ -1,15 +1,28 @@
+import re
+
 import pandas as pd
+import pyarrow as pa
+from pandas.api.types import is_string_dtype
 
 from ..namespaces import data_ns
 from .base_reader import CSVReader
 
-UNITS = ["°F", "°%", "°mph", "°in", r"\xa0", "Â", " "]
+UNITS = ["°F", "°%", "°mph", "°in", "\xa0", "Â", " "]
+# all units removed in a single regex pass
+UNITS_PATTERN = "|".join(map(re.escape, UNITS))
+# format of joined date and time columns, e.g. 2021-09-27 1:30 AM
+DATETIME_FORMAT = "%Y-%m-%d %I:%M %p"
 TEMPERATURE = "Temperature"
 WIND_SPEED = "Wind_Speed"
 
 
 class WeatherReader(CSVReader):
+    _FORMAT_COLUMNS = [data_ns.DATE, "Time"]
+    # numeric values come with unit suffixes, they are parsed in _format
+    NUMERIC_TYPE = pa.string()
+
     def _format(self, data: pd.DataFrame) -> pd.DataFrame:
+        # the only copy, helpers below modify the frame in place
         df = data.copy()
         df = self._format_numeric_columns(data=df)
         df = self._format_date_column(df)
@@ -17,45 +30,41 @@ class WeatherReader(CSVReader):
 
     def _format_numeric_columns(self, data: pd.DataFrame) -> pd.DataFrame:
         """Formats numeric columns and converts their data type to numeric"""
-        df = data.copy()
-        df = self._remove_units_and_signs(data=df)
-        df[self._meta.numeric_cols] = df[self._meta.numeric_cols].apply(pd.to_numeric)
-        df = self._convert_units(df)
-        return df
+        data = self._remove_units_and_signs(data=data)
+        numeric_cols = list(self._meta.numeric_cols)
+        data[numeric_cols] = data[numeric_cols].apply(pd.to_numeric)
+        return self._convert_units(data)
 
     def _remove_units_and_signs(self, data: pd.DataFrame) -> pd.DataFrame:
-        """Removes suffixes and signs from data"""
-        df = data.copy()
-        df = df.replace(UNITS, "", regex=True)
-        return df
+        """Removes suffixes and signs from numeric columns read as text"""
+        for col in self._meta.numeric_cols:
+            if is_string_dtype(data[col]):
+                data[col] = data[col].str.replace(UNITS_PATTERN, "", regex=True)
+        return data
 
     def _convert_units(self, data: pd.DataFrame) -> pd.DataFrame:
         """Converts units from american to standard metrics"""
 
-        def to_celcius(o: float, dec: int = 0) -> float:
+        def to_celcius(o: pd.Series, dec: int = 0) -> pd.Series:
             num = ((o - 32) * 5) / 9
-            return round(num, dec)
+            return num.round(dec)
 
-        def to_kmh(o: float, dec: int = 0) -> float:
+        def to_kmh(o: pd.Series, dec: int = 0) -> pd.Series:
             num = o * 1.609344
-            return round(num, dec)
+            return num.round(dec)
 
-        df = data.copy()
-        df[TEMPERATURE] = df[TEMPERATURE].apply(to_celcius)
-        df[WIND_SPEED] = df[WIND_SPEED].apply(to_kmh)
-        return df
+        # conversions operate on whole columns at once
+        data[TEMPERATURE] = to_celcius(data[TEMPERATURE])
+        data[WIND_SPEED] = to_kmh(data[WIND_SPEED])
+        return data
 
     def _format_date_column(self, data: pd.DataFrame) -> pd.DataFrame:
         """Formats date colum and drops redundant entries"""
-        df = data.copy()
-        date = df[data_ns.DATE] + " " + df["Time"]
-        df[data_ns.TIME] = pd.to_datetime(date)
-        df = self._drop_half_hours(df)
-        return df
+        date = data[data_ns.DATE].str.cat(data["Time"], sep=" ")
+        data[data_ns.TIME] = pd.to_datetime(date, format=DATETIME_FORMAT, cache=True)
+        return self._drop_half_hours(data)
 
     def _drop_half_hours(self, data: pd.DataFrame) -> pd.DataFrame:
         """Drops entries from incomplete hours like 1:30 AM"""
-        df = data.copy()
-        mask = df[data_ns.TIME].apply(lambda x: x.minute == 0)
-        df = df.loc[mask]
-        return df
+        mask = data[data_ns.TIME].dt.minute.to_numpy() == 0
+        return data.loc[mask]
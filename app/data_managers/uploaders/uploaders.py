@@ -8,10 +8,14 @@ from ..namespaces import data_ns
 from .utils import create_directory
 
 PATH = Path | str
+# explicit format of written time index, so it is not inferred on every write
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 class BaseUploader(ABC):
     _ext: str
+    # whether new entries can be appended to target file without rewriting it
+    _appendable: bool = False
 
     def __init__(self, file: PATH, copy: bool = True) -> None:
         path = Path(file)
@@ -20,22 +24,65 @@ class BaseUploader(ABC):
         self.file = path
         self._copy = copy
         create_directory(file)
+        # checked once, target file exists after first upload
+        self._exist = self.file.exists()
 
     @property
     def _exists(self) -> bool:
         """Return True if uploader target file exists"""
-        return self.file.exists()
+        return self._exist
 
     def upload(self, data: pd.DataFrame) -> None:
         existing = self._read() if self._exists else pd.DataFrame()
-        new = data.loc[~data.index.isin(existing.index)]
-        concat = pd.concat((existing, new)).sort_index()
+        new = self._get_new_entries(data, existing)
+        if self._exists and new.empty:
+            return
         if self._exists and self._copy:
             self._copy_file()
-        self._upload(concat)
+        if self._is_appendable(existing, new):
+            self._append(new.sort_index())
+        else:
+            concat = pd.concat((existing, new)).sort_index()
+            self._upload(concat)
+        self._exist = True
+
+    def _get_new_entries(
+        self, data: pd.DataFrame, existing: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Returns entries of data with index not present in existing data"""
+        if existing.empty:
+            return data
+        index, existing_index = data.index, existing.index
+        if not (
+            index.is_monotonic_increasing and existing_index.is_monotonic_increasing
+        ):
+            return data.loc[~index.isin(existing_index)]
+        # sorted indices are matched by binary search, without building hash table
+        pos = existing_index.searchsorted(index)
+        last = len(existing_index) - 1
+        mask = (pos > last) | (
+            existing_index.to_numpy()[pos.clip(max=last)] != index.to_numpy()
+        )
+        return data.iloc[mask]
+
+    def _is_appendable(self, existing: pd.DataFrame, new: pd.DataFrame) -> bool:
+        """
+        Return True if new data can be appended at the end of target file,
+        without reordering existing entries
+        """
+        return (
+            self._appendable
+            and not existing.empty
+            and list(new.columns) == list(existing.columns)
+            and new.index.min() > existing.index.max()
+        )
+
+    def _append(self, data: pd.DataFrame) -> None:
+        """Appends data newer than all existing entries to target file"""
+        raise NotImplementedError(f"{type(self).__name__} does not support appending")
 
     def _copy_file(self) -> None:
-        path = str(self.file).replace(f".{self._ext}", f"_copy.{self._ext}")
+        path = self.file.with_name(f"{self.file.stem}_copy{self._ext}")
         shutil.copy(self.file, path)
 
     @abstractmethod
@@ -49,13 +96,20 @@ class BaseUploader(ABC):
 
 class CSVUploader(BaseUploader):
     _ext = ".csv"
+    _appendable = True
 
     def _read(self) -> pd.DataFrame:
-        df = pd.read_csv(self.file, parse_dates=[data_ns.TIME], index_col=data_ns.TIME)
+        # multithreaded pyarrow parser, it reads date-only entries as dates,
+        # so index is converted to datetime explicitly
+        df = pd.read_csv(self.file, index_col=data_ns.TIME, engine="pyarrow")
+        df.index = pd.to_datetime(df.index)
         return df
 
     def _upload(self, data: pd.DataFrame) -> None:
-        data.to_csv(self.file)
+        data.to_csv(self.file, date_format=DATE_FORMAT)
+
+    def _append(self, data: pd.DataFrame) -> None:
+        data.to_csv(self.file, mode="a", header=False, date_format=DATE_FORMAT)
 
 
 class ExcelUploader(BaseUploader):
@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 
 PATH = Path | str
@@ -15,14 +14,6 @@ def create_directory(path: PATH) -> None:
     Makes sure that the target directory exists
     """
     path = Path(path)
-
-    # if path exists, it means there is a directory
-    if path.exists():
-        return
-    # if path is non-existing directory, create directory
-    if path.is_dir():
-        os.makedirs(path)
-    # if path is non-existing file, check if there is a directory, if not - create it
-    if path.is_file():
-        if not path.parent.exists():
-            os.makedirs(path.parent)
+    # non-existing path with suffix is a file, it needs its parent directory
+    directory = path.parent if path.is_file() or path.suffix else path
+    directory.mkdir(parents=True, exist_ok=True)
@@ -1 +1 @@
-from .source_metadata import SourceMetaData
+from .source_metadata import SourceMetaData, get_source_metadata
@@ -1,31 +1,53 @@
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping
 
 from ...exceptions import SourceNamespaceException, UnknownSource
 from ..namespaces import data_ns, sources_ns
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SourceMetaData:
-    source: str
-
-    def __post_init__(self) -> None:
-        source = self._get_source_ns()
-        self.renames = source.get(data_ns.RENAMES, {})
-        self.numeric_cols = source.get(data_ns.NUMERIC_COLUMNS, [])
-        self.freq = self._get_frequency(ns=source)
-
-    def _get_source_ns(self) -> dict:
-        ns: dict = vars(sources_ns)
-
-        if self.source not in ns:
-            raise UnknownSource(f"{self.source} is unknown")
+    """Immutable metadata of data source resolved from sources_ns"""
 
-        return ns[self.source]
-
-    def _get_frequency(self, ns: dict) -> str:
-        if data_ns.FREQ not in ns:
-            raise SourceNamespaceException(
-                f"{self.source} is missing {data_ns.FREQ} key in the namespace"
-            )
-
-        return ns[data_ns.FREQ]
+    source: str
+    renames: Mapping[str, str]
+    numeric_cols: tuple[str, ...]
+    freq: str
+    # numeric and time columns that are kept in formatted data
+    valid_cols: frozenset[str]
+
+
+@cache
+def get_source_metadata(source: str) -> SourceMetaData:
+    """
+    Returns metadata of data source, resolved once per source.
+
+    Raises
+    ------
+    UnknownSource
+        If source is not defined in sources_ns
+    SourceNamespaceException
+        If source namespace is missing frequency
+    """
+    ns: dict = vars(sources_ns)
+
+    if source not in ns:
+        raise UnknownSource(f"{source} is unknown")
+
+    source_ns = ns[source]
+
+    if data_ns.FREQ not in source_ns:
+        raise SourceNamespaceException(
+            f"{source} is missing {data_ns.FREQ} key in the namespace"
+        )
+
+    numeric_cols = tuple(source_ns.get(data_ns.NUMERIC_COLUMNS, []))
+    return SourceMetaData(
+        source=source,
+        renames=MappingProxyType(dict(source_ns.get(data_ns.RENAMES, {}))),
+        numeric_cols=numeric_cols,
+        freq=source_ns[data_ns.FREQ],
+        valid_cols=frozenset(numeric_cols) | {data_ns.TIME},
+    )
@@ -1,2 +1,20 @@
-from .backtesting import TSBacktesting
-from .splitter import get_splitter
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .backtesting import TSBacktesting
+    from .splitter import get_splitter
+
+__all__ = ["TSBacktesting", "get_splitter"]
+
+# modules re-exported lazily, they import sktime which is slow to load
+# and not needed for transformers or plotting
+_LAZY_EXPORTS = {"TSBacktesting": ".backtesting", "get_splitter": ".splitter"}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
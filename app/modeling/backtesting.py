@@ -1,9 +1,11 @@
 import logging
 import warnings
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional, TypeVar
 
+import numpy as np
 import pandas as pd
-from sktime.forecasting.base import BaseForecaster
+from joblib import Parallel, delayed
+from sktime.forecasting.base import BaseForecaster, ForecastingHorizon
 from sktime.forecasting.model_selection._split import BaseSplitter
 from sktime.performance_metrics.forecasting import (
     MeanAbsoluteError,
@@ -13,6 +15,10 @@ from sktime.performance_metrics.forecasting import (
 from sktime.performance_metrics.forecasting._classes import BaseForecastingErrorMetric
 
 from ..data_managers.namespaces import data_ns
+from .splitter import ExpandingWindowSplitter, SlidingWindowSplitter, _log_window
+from .splitter import logger as _splitter_logger
+
+T = TypeVar("T")
 
 DEFAULT_METRICS = {
     "MAPE": MeanAbsolutePercentageError(),
@@ -20,15 +26,116 @@ DEFAULT_METRICS = {
     "RMSE": MeanSquaredError(square_root=True),
 }
 
+# parameters of sktime metrics with column-wise numpy implementation
+VECTORIZED_PARAMS = {"multilevel": "uniform_average", "multioutput": "uniform_average"}
+# the same epsilon as in sktime percentage error
+EPS = np.finfo(np.float64).eps
+
 DECORATORS = Optional[list[Callable[[Callable], pd.DataFrame]]]
 
 
-# TODO: implement asynch run
+def _silence_loggers() -> None:
+    """Turns off cmdstanpy logger used by sktime"""
+    # logger used by sktime
+    logger = logging.getLogger("cmdstanpy")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.CRITICAL)
+
+    # silence models warnings like ex. ConverganceError
+    warnings.filterwarnings("ignore")
+
+
+def _column_mean(errors: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """Column-wise mean of errors, only valid entries are averaged"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, errors, 0).sum(axis=0) / valid.sum(axis=0)
+
+
+def _get_vectorized_metric(
+    metric: BaseForecastingErrorMetric,
+) -> Optional[Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]]:
+    """
+    Returns column-wise numpy implementation of default MAE, MAPE, MSE
+    or RMSE sktime metric, that calculates errors of all models at once
+    from differences between actuals and forecasts.
+    Returns None for any other metric or metric with custom parameters.
+    """
+    if type(metric) not in (
+        MeanAbsoluteError,
+        MeanAbsolutePercentageError,
+        MeanSquaredError,
+    ):
+        return None
+    params = metric.get_params()
+    square_root = params.pop("square_root", False)
+    symmetric = params.pop("symmetric", False)
+    if params != VECTORIZED_PARAMS or symmetric:
+        return None
+
+    if type(metric) is MeanAbsoluteError:
+        return lambda diff, actuals, valid: _column_mean(np.abs(diff), valid)
+    if type(metric) is MeanAbsolutePercentageError:
+        return lambda diff, actuals, valid: _column_mean(
+            np.abs(diff / np.maximum(np.abs(actuals), EPS)), valid
+        )
+    post = np.sqrt if square_root else np.asarray
+    return lambda diff, actuals, valid: post(_column_mean(diff * diff, valid))
+
+
+class _PrecomputedSplitter:
+    """
+    Splitter replaying train and test windows of another splitter,
+    windows are generated once and shared by all evaluated models.
+    Progress of framework splitters is logged when windows are replayed,
+    so it follows modeling instead of precomputation.
+    """
+
+    def __init__(self, splitter: BaseSplitter, y: pd.Series) -> None:
+        self.fh = splitter.fh
+        self._log = isinstance(
+            splitter, (ExpandingWindowSplitter, SlidingWindowSplitter)
+        )
+        disabled = _splitter_logger.disabled
+        _splitter_logger.disabled = True
+        try:
+            self._folds = list(splitter.split(y))
+        finally:
+            _splitter_logger.disabled = disabled
+
+    def split(self, y: pd.Series) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        for counter, (train, test) in enumerate(self._folds, start=1):
+            if self._log:
+                _log_window(counter, test)
+            yield train, test
+
+
+def _fit_predict(
+    y: pd.Series,
+    model: BaseForecaster,
+    fh: ForecastingHorizon,
+    train: np.ndarray,
+    test: np.ndarray,
+    X: Optional[pd.DataFrame] = None,
+) -> pd.Series:
+    """
+    Fits model on train set and predicts values of following test set,
+    X is expected to be DataFrame or None
+    """
+    # fitting
+    exo = None if X is None else X.iloc[train]
+    model_trained = model.fit(y.iloc[train], X=exo, fh=fh)
+    # predicting
+    exo = None if X is None else X.iloc[test]
+    return model_trained.predict(fh=fh, X=exo)
+
+
 def _evaluate(
     y: pd.Series,
     model: BaseForecaster,
     splitter: BaseSplitter,
     X: Optional[pd.DataFrame] = None,
+    n_jobs: int = 1,
 ) -> pd.Series:
     """
     Evaluate a time series forecasting model using a given splitter.
@@ -43,29 +150,65 @@ def _evaluate(
         The splitter object used for train-test splitting.
     X: pd.DataFrame, optional
         The exogenous variables (if any). Defaults to None.
+    n_jobs: int, optional
+        Number of worker processes fitting folds concurrently, each fold is
+        fitted on a separate clone of the model. Defaults to 1, folds are
+        fitted sequentially and evaluation can be interrupted.
 
     Returns
     -------
     pd.Series
         The concatenated predictions made by the model with datetime index.
     """
-    results = pd.Series()
+    # exogenous variables are resolved once, not in every fold
+    if not isinstance(X, pd.DataFrame):
+        X = None
+
+    if n_jobs != 1:
+        preds = Parallel(n_jobs=n_jobs, prefer="processes")(
+            delayed(_run_silenced)(
+                _fit_predict, y, model.clone(), splitter.fh, train, test, X
+            )
+            for train, test in splitter.split(y)
+        )
+        return _concat_predictions(preds)
+
+    preds = []
 
     try:
         for train, test in splitter.split(y):
-            # fitting
-            exo = X.iloc[train] if isinstance(X, pd.DataFrame) else None
-            model_trained = model.fit(y.iloc[train], X=exo, fh=splitter.fh)
-            # predicting
-            exo = X.iloc[test] if isinstance(X, pd.DataFrame) else None
-            pred = model_trained.predict(fh=splitter.fh, X=exo)
-            results = pd.concat((results, pred))  # type: ignore
+            preds.append(_fit_predict(y, model, splitter.fh, train, test, X))
     # function can be interrupted at any time, Series with successfully predicted
-    # sets are returned, exception is raised to be handled in TSBacktesting component
+    # sets is returned, other exceptions are propagated
     except KeyboardInterrupt:
-        raise
-    finally:
-        return results
+        logging.warning(f"Evaluation interrupted after {len(preds)} forecasts")
+    return _concat_predictions(preds)
+
+
+def _concat_predictions(preds: list[pd.Series]) -> pd.Series:
+    """
+    Concatenates predictions of consecutive test sets in one pass,
+    sets have the same dtype, so pandas concat validation is skipped
+    """
+    if not preds:
+        return pd.Series(dtype=float)
+    values = np.concatenate([pred.to_numpy() for pred in preds])
+    index = preds[0].index.append([pred.index for pred in preds[1:]])
+    return pd.Series(values, index=index)
+
+
+def _run_silenced(func: Callable[..., T], *args) -> T:
+    """
+    Runs func with silenced loggers and warnings, loggers have to be
+    silenced again in each worker process.
+    """
+    _silence_loggers()
+    return func(*args)
+
+
+def _evaluate_named(name: str, *args) -> tuple[str, pd.Series]:
+    """Evaluates model, name is returned along forecasts as they come unordered"""
+    return name, _evaluate(*args)
 
 
 class TSBacktesting:
@@ -91,6 +234,8 @@ class TSBacktesting:
         models: dict[str, BaseForecaster],
         metrics: dict[str, BaseForecastingErrorMetric] = DEFAULT_METRICS,
         decorators: DECORATORS = None,
+        n_jobs: int = 1,
+        fold_jobs: int = 1,
     ) -> None:
         """
         Initialize the time series backtesting component.
@@ -114,8 +259,20 @@ class TSBacktesting:
             List of decorator function that would enhance evaluate method by adding
             extra functionality, they should take callable as an input, and return
             the DataFrame with modeling results. By default, no decorator is applied.
+        n_jobs: int, optional
+            Number of worker processes evaluating models concurrently, models are
+            independent so each one is backtested in a separate process.
+            By default, 1, models are evaluated sequentially in the current
+            process and are left fitted. If -1, all cores are used, models are
+            pickled to workers and the passed objects are not fitted.
+        fold_jobs: int, optional
+            Number of worker processes fitting folds of each model concurrently,
+            useful for few models with many folds. By default, 1, folds are fitted
+            sequentially. Nested in model workers, if both are used.
         """
         self._models = models
+        self._n_jobs = n_jobs
+        self._fold_jobs = fold_jobs
         self._splitter = splitter
         self._metrics = metrics
         self._errors = pd.DataFrame()
@@ -123,25 +280,10 @@ class TSBacktesting:
             for func in decorators:
                 self.evaluate = func(self.evaluate)  # type: ignore
 
-    def _silence_loggers(self) -> None:
-        """Turns off cmdstanpy logger used by sktime"""
-        import logging
-
-        # logger used by sktime
-        logger = logging.getLogger("cmdstanpy")
-        logger.addHandler(logging.NullHandler())
-        logger.propagate = False
-        logger.setLevel(logging.CRITICAL)
-
-        # silence models warnings like ex. ConverganceError
-        warnings.filterwarnings("ignore")
-
     @property
     def errors_(self) -> pd.DataFrame:
-        """Return the evaluation metrics for each model"""
-        return self._errors.sort_values(
-            by=self._errors.columns.to_list(), ascending=True
-        )
+        """Return the evaluation metrics for each model, sorted by metrics"""
+        return self._errors
 
     def evaluate(self, y: pd.Series, X: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
@@ -160,18 +302,40 @@ class TSBacktesting:
         pandas.DataFrame
             A dataframe of forecasts for each model.
         """
-        self._silence_loggers()
-        res = {}
-        for i, (name, model) in enumerate(self._models.items(), start=1):
-            logging.info(f"Model {i} -- {name}")
-            try:
-                res[name] = _evaluate(y, model=model, splitter=self._splitter, X=X)
-            except KeyboardInterrupt:
-                break
-
-        results = pd.DataFrame(res)
-        self._errors = self._calculate_errors(results, y)
-        results[data_ns.ACTUAL] = y.loc[results.index]
+        _silence_loggers()
+        # single model is evaluated in current process, without pickling it
+        n_jobs = self._n_jobs if len(self._models) > 1 else 1
+        splitter = _PrecomputedSplitter(self._splitter, y)
+        preds = Parallel(
+            n_jobs=n_jobs, prefer="processes", return_as="generator_unordered"
+        )(
+            delayed(_run_silenced)(
+                _evaluate_named, name, y, model, splitter, X, self._fold_jobs
+            )
+            for name, model in self._models.items()
+        )
+        res: dict[str, pd.Series] = {}
+        # forecasts of models finished before interruption are kept
+        try:
+            for i, (name, pred) in enumerate(preds, start=1):
+                logging.info(f"Model {i}/{len(self._models)} -- {name} evaluated")
+                res[name] = pred
+        except KeyboardInterrupt:
+            logging.warning(f"Evaluation interrupted after {len(res)} models")
+        res = {name: res[name] for name in self._models if name in res}
+
+        # forecasts are aligned in a single union join
+        results = (
+            pd.concat(
+                [pred.rename(name) for name, pred in res.items()], axis=1, copy=False
+            )
+            if res
+            else pd.DataFrame()
+        )
+        errors = self._calculate_errors(results, y)
+        # sorted once, stable sort keeps order of models with equal errors
+        self._errors = errors.sort_values(by=list(errors.columns), kind="mergesort")
+        results[data_ns.ACTUAL] = y.reindex(results.index, copy=False)
         return results
 
     def _calculate_errors(self, results: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
@@ -190,13 +354,38 @@ class TSBacktesting:
         pandas.DataFrame
             A dataframe of evaluation metrics for each model.
         """
-        metrics = results.apply(lambda x: self._get_metrics(x, y)).to_dict()
-        return pd.DataFrame(metrics).T
+        forecasts = results.to_numpy(dtype=float)
+        actuals = y.reindex(results.index).to_numpy(dtype=float)[:, None]
+        # metrics are calculated on entries with both actual and forecast
+        valid = ~np.isnan(forecasts) & ~np.isnan(actuals)
+        # differences are shared by all vectorized metrics
+        diff = actuals - forecasts
+
+        names = list(self._metrics)
+        errors = np.empty((len(results.columns), len(names)))
+        fallback = {}
+        for i, (name, metric) in enumerate(self._metrics.items()):
+            func = _get_vectorized_metric(metric)
+            if func is None:
+                fallback[name] = metric
+            else:
+                errors[:, i] = func(diff, actuals, valid)
+
+        # custom metrics are called for each model separately
+        if fallback:
+            y = y.dropna()
+            positions = [names.index(name) for name in fallback]
+            for i, (_, forecast) in enumerate(results.items()):
+                metrics = self._get_metrics(forecast, y, fallback)
+                errors[i, positions] = list(metrics.values())
+
+        return pd.DataFrame(errors, index=results.columns, columns=names)
 
     def _get_metrics(
         self,
         forecast: pd.Series,
         actuals: pd.Series,
+        metrics: Optional[dict[str, BaseForecastingErrorMetric]] = None,
     ) -> dict:
         """
         Calculate the specified performance metrics for a single evaluated model
@@ -211,7 +400,10 @@ class TSBacktesting:
             with datetime index for a single evaluated model.
         actuals: pd.Series
             A Series object containing the actual values to be used
-            with datetime index for error metric calculation.
+            with unique datetime index for error metric calculation,
+            without missing values.
+        metrics: dict, optional
+            Metrics to calculate, by default all metrics of the component.
 
         Returns:
         --------
@@ -219,11 +411,15 @@ class TSBacktesting:
             A dictionary object containing the calculated error
             metrics for the evaluated model.
         """
-        actuals = actuals.dropna()
+        # get only the intersection of index for calculating metrics,
+        # positions of forecast entries in actuals are resolved once for all metrics
         forecast = forecast.dropna()
-        # get only the intersection of index for calculating metrics
-        mask = forecast.index.intersection(actuals.index)
+        positions = actuals.index.get_indexer(forecast.index)
+        found = positions >= 0
+        actual_values = np.take(actuals.to_numpy(), positions[found])
+        forecast_values = forecast.to_numpy()[found]
+        metrics = self._metrics if metrics is None else metrics
         return {
-            name: metric(actuals.loc[mask], forecast.loc[mask])
-            for name, metric in self._metrics.items()
+            name: metric(actual_values, forecast_values)
+            for name, metric in metrics.items()
         }
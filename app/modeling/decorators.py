@@ -1,7 +1,7 @@
 from datetime import datetime
-from functools import wraps
+from functools import partial, wraps
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 import pandas as pd
 from matplotlib import pyplot as plt
@@ -11,12 +11,39 @@ from app.data_managers.namespaces import data_ns, files_ns
 from ..data_managers.uploaders.utils import create_directory
 from .plotting import plot_forecast
 
+# resolution of saved plots, enough for embedding in reports
+PLOT_DPI = 100
+
 
 def get_time() -> str:
     return datetime.now().strftime("%d-%m_%H_%M_%S")
 
 
-def save_results(f: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+def _write_results(out: pd.DataFrame, path: Path, file_format: str) -> None:
+    """Writes modeling results to the file of given format"""
+    if file_format == "parquet":
+        out.to_parquet(path, engine="pyarrow", compression="zstd")
+    elif file_format == "csv":
+        out.to_csv(path)
+    else:
+        raise ValueError(f"Unsupported results format {file_format}")
+
+
+def save_results(
+    f: Optional[Callable[..., pd.DataFrame]] = None, *, file_format: str = "parquet"
+) -> Callable[..., pd.DataFrame]:
+    """
+    Saves DataFrame returned by decorated function to results folder.
+    Can be used directly as decorator or called with file_format first.
+
+    Parameters
+    ----------
+    file_format : str, optional
+        Format of results file, parquet (default) or csv for human inspection.
+    """
+    if f is None:
+        return partial(save_results, file_format=file_format)  # type: ignore
+
     @wraps(f)
     def wrapper(*args, **kwargs):
         out = f(*args, **kwargs)
@@ -24,8 +51,8 @@ def save_results(f: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
         create_directory(folder)
 
         now = get_time()
-        path = folder / f"{now}.csv"
-        out.to_csv(path)
+        path = folder / f"{now}.{file_format}"
+        _write_results(out, path, file_format)
         return out
 
     return wrapper
@@ -42,18 +69,20 @@ def save_plots(
             folder = Path(files_ns.DATA_FOLDER, files_ns.PLOTS_FOLDER)
             create_directory(folder)
 
+            now = get_time()
             for model in out.columns:
                 if model == data_ns.ACTUAL:
                     continue
-                plot_forecast(
+                fig = plot_forecast(
                     out[model].iloc[slice],
                     out[data_ns.ACTUAL].iloc[slice],
                     freq=freq,
                     model=model,
                 )
-                now = get_time()
                 path = folder / f"{model}_{now}.png"
-                plt.savefig(path)
+                fig.savefig(path, dpi=PLOT_DPI, bbox_inches="tight")
+                # figures are not kept by pyplot after they are saved
+                plt.close(fig)
             return out
 
         return wrapper
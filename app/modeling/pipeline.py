@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from sklearn.pipeline import Pipeline as _Pipeline
 
@@ -5,4 +6,22 @@ from sklearn.pipeline import Pipeline as _Pipeline
 class Pipeline(_Pipeline):
     def fit_transform(self, *args, **kwargs) -> pd.DataFrame:
         x = super().fit_transform(*args, **kwargs)
-        return pd.DataFrame(x)
+        # transformers of the framework already return DataFrames
+        if isinstance(x, pd.DataFrame):
+            return x
+        return pd.DataFrame(x, columns=self._get_columns(x), copy=False)
+
+    def fit_transform_np(self, *args, **kwargs) -> np.ndarray:
+        """Fits pipeline and returns transformed data as numpy array"""
+        return np.asarray(super().fit_transform(*args, **kwargs))
+
+    def _get_columns(self, x) -> pd.Index | None:
+        """Returns output column names of the last step, if it provides them"""
+        last = self._final_estimator
+        if not hasattr(last, "get_feature_names_out"):
+            return None
+        try:
+            columns = pd.Index(last.get_feature_names_out())
+        except (AttributeError, ValueError):
+            return None
+        return columns if len(columns) == np.shape(x)[1] else None
@@ -1,17 +1,26 @@
 import pandas as pd
 from matplotlib import pyplot as plt
+from matplotlib.figure import Figure
 
 
 def plot_forecast(
     forecast: pd.Series, actuals: pd.Series, freq: str = "H", model: str = ""
-):
-    plt.figure(figsize=(8, 5))
-    plt.plot(actuals.resample(freq).mean(), color="blue", label="Actuals")
-    plt.plot(forecast.resample(freq).mean(), color="orange", label=model)
-    plt.xticks(rotation=30, ha="right")
+) -> Figure:
+    # both series are resampled in one groupby over two columns
+    resampled = (
+        pd.concat({"actuals": actuals, "forecast": forecast}, axis=1)
+        .resample(freq)
+        .mean()
+    )
+    fig, ax = plt.subplots(figsize=(8, 5))
+    # lines are rasterized, so saving does not walk every vector segment
+    ax.plot(resampled["actuals"], color="blue", label="Actuals", rasterized=True)
+    ax.plot(resampled["forecast"], color="orange", label=model, rasterized=True)
+    fig.autofmt_xdate(rotation=30, ha="right")
 
-    plt.title("Electricity price forecasting")
-    plt.xlabel("Date")
-    plt.ylabel("Price")
-    plt.tight_layout()
-    plt.legend()
+    ax.set_title("Electricity price forecasting")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Price")
+    fig.tight_layout()
+    ax.legend()
+    return fig
@@ -1,8 +1,8 @@
 import logging
-import random
 from datetime import datetime
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from sktime.forecasting.base import ForecastingHorizon
 from sktime.forecasting.model_selection import ExpandingWindowSplitter as _EWS
@@ -13,14 +13,21 @@ DEFAULT_STEP_LENGTH = 24
 DEFAULT_FRAC = 0.1
 DEFAULT_SEED = 42
 
+logger = logging.getLogger(__name__)
+
+
+def _log_window(counter: int, test) -> None:
+    """Logs modeling progress, message is formatted only if INFO is enabled"""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%d forecast -- last index: %s", counter, test[-1])
+
 
 class ExpandingWindowSplitter(_EWS):
     def _split_windows(self, **kwargs):
         """Overriden spit_window method that logs modeling progress"""
         gen = super()._split_windows(**kwargs)
         for counter, (train, test) in enumerate(gen, start=1):
-            mes = f"{counter} forecast -- last index: {test[-1]}"
-            logging.info(mes)
+            _log_window(counter, test)
             yield train, test
 
 
@@ -29,8 +36,7 @@ class SlidingWindowSplitter(_SWS):
         """Overriden spit_window method that logs modeling progress"""
         gen = super()._split_windows(**kwargs)
         for counter, (train, test) in enumerate(gen, start=1):
-            mes = f"{counter} forecast -- last index: {test[-1]}"
-            logging.info(mes)
+            _log_window(counter, test)
             yield train, test
 
 
@@ -48,7 +54,9 @@ class TestingSplitter(ExpandingWindowSplitter):
     app.modeling.backtesting TSBacktesting
     """
 
-    def __init__(self, *args, frac: float = DEFAULT_FRAC, **kwargs) -> None:
+    def __init__(
+        self, *args, frac: float = DEFAULT_FRAC, seed: int = DEFAULT_SEED, **kwargs
+    ) -> None:
         """Initializes TestingSplitter object
 
         Parameters
@@ -57,6 +65,9 @@ class TestingSplitter(ExpandingWindowSplitter):
             fraction of windows to yield from entire validation set.
             1 being all windows (working as standard ExpandingWindowSplitter),
             0 not yielding any window for evaluation.
+        seed : int, optional
+            seed of random windows selection, the same windows are yielded
+            on every split.
 
         Raises
         ------
@@ -67,20 +78,21 @@ class TestingSplitter(ExpandingWindowSplitter):
         if not (0 <= frac <= 1):
             raise ValueError(f"frac must be between 0 and 1, got {frac}")
         self._frac = frac
+        self._seed = seed
 
     def _split_windows(self, **kwargs):
         """Overriden spit_window method that yield with frac probability"""
-        # seed for reproducibility across different models (the same windows modelled)
-        random.seed(DEFAULT_SEED)
+        # local generator seeded on every split, so the same windows are modelled
+        # across different models and global random state is not affected
+        rng = np.random.default_rng(self._seed)
         gen = self._split_windows_generic(expanding=True, **kwargs)
         counter = 1
         for train, test in gen:
-            rand = random.random()
-            if rand <= self._frac:
-                mes = f"{counter} forecast -- last index: {test[-1]}"
-                counter += 1
-                logging.info(mes)
-                yield train, test
+            if rng.random() > self._frac:
+                continue
+            _log_window(counter, test)
+            counter += 1
+            yield train, test
 
 
 def get_splitter(
@@ -164,8 +176,7 @@ def split_series(
 
     Notes
     -----
-    - The function creates a copy of the input series 'y'
-        to avoid modifying the original data.
+    - Returned sets are copies, so the original data is not modified.
     - The train set includes the data from 'train_start' (inclusive) until
         'train_end' (exclusive) or until the first 'test_len'
         elements if 'test_len' is specified.
@@ -174,7 +185,8 @@ def split_series(
     - If 'train_start' is specified, the function will filter the series
         to include data from 'train_start' onwards.
     - If 'train_end' is specified, the function will use it as the boundary
-        for the train set. Otherwise, a boolean mask is created to mark the train set indices.
+        for the train set. Otherwise, the series is split by position.
+    - Sorted index is split with binary search instead of boolean masks.
     - If 'test_len' is specified, the test set will be truncated
         to have at most 'test_len' elements.
 
@@ -193,26 +205,36 @@ def split_series(
     8    9
     dtype: int64
     """
-    y = y.copy()
-
-    if train_start is not None:
-        y = y.loc[y.index >= train_start]
-
     if train_end is None and test_len is None:
         raise ValueError(
             "One of the parameters: train_end or test_len must be "
             "specified to split series"
         )
-    if train_end is None:
-        train_mask = pd.Series(False, index=y.index)
-        train_mask[:test_len] = True
-    else:
-        train_mask = y.index < train_end
 
-    train = y.loc[train_mask]
-    test = y.loc[~train_mask]
+    # sorted index (usual for time series) is split by binary search
+    # into positional slices, otherwise boolean masks are used
+    monotonic = y.index.is_monotonic_increasing
 
-    if test_len is not None:
-        test = test.iloc[:test_len]
+    if train_start is not None:
+        if monotonic:
+            y = y.iloc[y.index.searchsorted(train_start, side="left") :]
+        else:
+            y = y[y.index >= train_start]
 
+    if train_end is None:
+        split = test_len
+    elif monotonic:
+        split = y.index.searchsorted(train_end, side="left")
+    else:
+        train_mask = y.index < train_end
+        train = y[train_mask]
+        test = y[~train_mask]
+        if test_len is not None:
+            test = test.iloc[:test_len]
+        return train, test
+
+    stop = None if test_len is None else split + test_len
+    # slices are copied as they are views of input
+    train = y.iloc[:split].copy()
+    test = y.iloc[split:stop].copy()
     return train, test
@@ -1,20 +1,123 @@
 import os
 from abc import ABC, abstractmethod
-from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
-from sktime.transformations.series.outlier_detection import HampelFilter
 
 from ...data_managers.namespaces import data_ns, files_ns
 from ...data_managers.readers.weather_reader import TEMPERATURE, WIND_SPEED
 
 PATH = Union[Path, str]
+# parameters of the Hampel filter, same as sktime defaults
+HAMPEL_N_SIGMA = 3
+HAMPEL_K = 1.4826
+DAY_NAMES = np.array(
+    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+)
+# day names sorted as columns of pd.get_dummies and their codes by day of week
+DAY_LABELS = np.sort(DAY_NAMES)
+DAY_CODES = np.searchsorted(DAY_LABELS, DAY_NAMES)
+# sorted, so season codes map to columns in order of pd.get_dummies
+SEASONS = np.array(["AUTUMN", "SPRING", "SUMMER", "WINTER"])
+
+
+def _indicators(codes: np.ndarray, labels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns indicator rows of present labels (first one dropped)
+    and their labels, as pd.get_dummies with drop_first would create.
+    """
+    present = np.flatnonzero(np.bincount(codes, minlength=len(labels)))[1:]
+    return codes == present[:, None], labels[present]
+
+
+def _one_hot(codes: np.ndarray, labels: np.ndarray, index: pd.Index) -> pd.DataFrame:
+    """
+    One-hot encodes integer codes of sorted labels, same as pd.get_dummies
+    with drop_first, but without factorizing labels.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        Integer codes, positions of values in labels.
+    labels : np.ndarray
+        Sorted labels used as column names.
+    index : pd.Index
+        Index of returned DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        int8 indicator columns of present labels, first one dropped.
+    """
+    rows, columns = _indicators(codes, labels)
+    # built transposed, so each indicator column is contiguous in memory
+    indicators = rows.T.astype(np.int8)
+    return pd.DataFrame(indicators, index=index, columns=columns, copy=False)
+
+
+def _hampel_filter(values: np.ndarray, window_length: int) -> np.ndarray:
+    """
+    Hampel filter on numpy array, port of sktime's HampelFilter.
+    Values further than n sigma from median of sliding window are
+    replaced with nan, later windows skip previously detected outliers.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        One dimensional array of values to filter.
+    window_length : int
+        The length of the sliding window.
+
+    Returns
+    -------
+    np.ndarray
+        Copy of values with outliers replaced by nan.
+    """
+    z = np.array(values, dtype=np.float64)
+    n = len(z)
+    half = window_length // 2
+    last_start = n - window_length - 1
+
+    # window length is fixed, so middle positions of median are resolved once
+    # and median of windows without nan is found with partial sort
+    kth = [(window_length - 1) // 2, window_length // 2]
+
+    def median_of(window: np.ndarray) -> float:
+        if np.isnan(window).any():
+            return np.nanmedian(window)
+        part = np.partition(window, kth)
+        return (part[kth[0]] + part[kth[1]]) / 2
+
+    def compare(idx, median: float, sigma: float) -> None:
+        outlier = np.abs(z[idx] - median) > HAMPEL_N_SIGMA * sigma
+        z[idx] = np.where(outlier, np.nan, z[idx])
+
+    for start in range(last_start + 1):
+        window = z[start : start + window_length]
+        median = median_of(window)
+        sigma = HAMPEL_K * median_of(np.abs(window - median))
+
+        end = start + window_length - 1
+        # first half of the first window and last half of the last window
+        if (start <= half or end >= n - half) and start in (0, last_start):
+            if start <= half:
+                compare(slice(start, half + 1), median, sigma)
+            else:
+                compare(slice(n - half - 1, n), median, sigma)
+        else:
+            compare(start + half, median, sigma)
+    return z
 
 
 class BaseTransformer(ABC):
+    """
+    Base class of feature transformers. Transformers only add or replace
+    columns on a shallow copy of input, so values of original columns
+    are shared with input DataFrame and should not be modified in place.
+    """
+
     def fit(self, X: pd.DataFrame, y):
         return self
 
@@ -29,9 +132,7 @@ class TrendCreator(BaseTransformer):
         return "TREND"
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        df = X.copy()
-        df[self.column] = np.arange(len(df))
-        return df
+        return X.assign(**{self.column: np.arange(len(X), dtype=np.int32)})
 
 
 class WeekendIndicatorCreator(BaseTransformer):
@@ -40,19 +141,14 @@ class WeekendIndicatorCreator(BaseTransformer):
         return "WEEKEND"
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        df = X.copy()
-        df[self.column] = list(map(lambda x: int(x.day_of_week in {5, 6}), df.index))
-        return df
+        return X.assign(**{self.column: (X.index.dayofweek >= 5).astype(np.int8)})
 
 
 class DayOfWeekIndicatorCreator(BaseTransformer):
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        df = X.copy()
-        day = np.array([date.day_name() for date in df.index])
-        day_dummies = pd.get_dummies(day, drop_first=True)
-        day_dummies = day_dummies.set_index(df.index)
-        df = pd.concat((df, day_dummies), axis=1)
-        return df
+        day_dummies = _one_hot(DAY_CODES[X.index.dayofweek], DAY_LABELS, X.index)
+        # dummies share index of X, so nothing is aligned and they stay one block
+        return pd.concat((X, day_dummies), axis=1, copy=False)
 
 
 class SeasonIndicatorCreator(BaseTransformer):
@@ -62,32 +158,28 @@ class SeasonIndicatorCreator(BaseTransformer):
     for creating three season boolean columns (one is dropped).
     """
 
-    def _get_season(self, x: datetime) -> str:
+    @staticmethod
+    def _get_season(index: pd.DatetimeIndex) -> np.ndarray:
         """
-        Returns the season based on the given datetime.
+        Returns the seasons based on the given datetime index.
 
         Parameters
         ----------
-        x : datetime
-            The datetime for which the season needs to be determined.
+        index : pd.DatetimeIndex
+            The datetimes for which the seasons need to be determined.
 
         Returns
         -------
-        str
-            The season corresponding to the given datetime.
+        np.ndarray
+            The codes of seasons (positions in SEASONS)
+            corresponding to the given datetimes.
         """
-        # random year
-        y = 2000
-        x = x.replace(year=y)
-
-        if x < datetime(y, 3, 21) or x > datetime(y, 12, 22):
-            return "WINTER"
-        elif x < datetime(y, 6, 22):
-            return "SPRING"
-        elif x < datetime(y, 9, 23):
-            return "SUMMER"
-        else:
-            return "AUTUMN"
+        # month and day encoded as MMDD, comparable across years
+        key = index.month.to_numpy() * 100 + index.day.to_numpy()
+        # winter starts right after midnight of 22nd of December
+        after_midnight = np.asarray(index != index.normalize())
+        winter = (key < 321) | (key > 1222) | ((key == 1222) & after_midnight)
+        return np.select([winter, key < 622, key < 923], [3, 1, 2], default=0)
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
@@ -103,12 +195,48 @@ class SeasonIndicatorCreator(BaseTransformer):
         pd.DataFrame
             The transformed DataFrame with season indicators.
         """
-        df = X.copy()
-        season = np.array([self._get_season(x) for x in df.index])
-        season_dummies = pd.get_dummies(season, drop_first=True)
-        season_dummies = season_dummies.set_index(df.index)
-        df = pd.concat((df, season_dummies), axis=1)
-        return df
+        season_dummies = _one_hot(self._get_season(X.index), SEASONS, X.index)
+        # dummies share index of X, so nothing is aligned and they stay one block
+        return pd.concat((X, season_dummies), axis=1, copy=False)
+
+
+class CalendarFeaturesCreator(BaseTransformer):
+    """
+    A transformer class creating all calendar features at once: trend,
+    weekend indicator, day of week and season indicators. Output is the same
+    as of pipeline of corresponding transformers, but index is read once
+    and DataFrame is concatenated once.
+    """
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transforms the input DataFrame by adding calendar features.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            The input DataFrame with datetime index to be transformed.
+
+        Returns
+        -------
+        pd.DataFrame
+            The transformed DataFrame with calendar features.
+        """
+        index = X.index
+        dow = index.dayofweek
+        trend = pd.DataFrame(
+            {TrendCreator().column: np.arange(len(X), dtype=np.int32)}, index=index
+        )
+        day_rows, day_columns = _indicators(DAY_CODES[dow], DAY_LABELS)
+        season = SeasonIndicatorCreator._get_season(index)
+        season_rows, season_columns = _indicators(season, SEASONS)
+        # all indicators are stacked into one int8 block, column-contiguous
+        indicators = np.vstack(((dow >= 5)[None, :], day_rows, season_rows))
+        columns = [WeekendIndicatorCreator().column, *day_columns, *season_columns]
+        block = pd.DataFrame(
+            indicators.T.astype(np.int8), index=index, columns=columns, copy=False
+        )
+        return pd.concat((X, trend, block), axis=1, copy=False)
 
 
 class LinearInterpolator(BaseTransformer):
@@ -117,15 +245,13 @@ class LinearInterpolator(BaseTransformer):
         return data_ns.VALUE
 
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
-        df = X.copy()
-        df[data_ns.VALUE] = df[data_ns.VALUE].interpolate()
-        return df
+        return X.assign(**{data_ns.VALUE: X[data_ns.VALUE].interpolate()})
 
 
 class OutlierFlagCreator(BaseTransformer):
     """
     A transformer class for creating outlier flags
-    in a DataFrame using the Hampel filter from sktime.
+    in a DataFrame using the Hampel filter (numpy port of sktime's).
     """
 
     @property
@@ -166,16 +292,17 @@ class OutlierFlagCreator(BaseTransformer):
             if return_bool is True, else smoothed values
             with outliers removed in VALUE column.
         """
-        df = X.copy()
-        hf = HampelFilter(
-            window_length=self.window_length, return_bool=self.return_bool
+        out = _hampel_filter(X[data_ns.VALUE].to_numpy(), self.window_length)
+        return X.assign(
+            **{self.column: np.isnan(out).astype(np.int8) if self.return_bool else out}
         )
-        out = hf.fit_transform(df[data_ns.VALUE])
-        df[self.column] = list(map(int, out)) if self.return_bool else out  # type: ignore
-        return df
 
 
 class BaseFileProvider(BaseTransformer):
+    # parsed source files shared by all instances, keyed by provider class,
+    # file path and modification time, so updated file is read again
+    _cache: dict[tuple[type, str, float], Union[pd.Series, pd.DatetimeIndex]] = {}
+
     def __init__(self, file: Optional[PATH] = None) -> None:
         """
         Parameters
@@ -215,16 +342,26 @@ class BaseFileProvider(BaseTransformer):
         pd.Series
             A series representing new feature for modeling
         """
-        data = pd.read_csv(
-            self.file,
-            parse_dates=[data_ns.TIME],
-            index_col=data_ns.TIME,
-            usecols=[0, 1],
-        )
-        data = data.squeeze()
+        data = pd.read_csv(self.file, engine="pyarrow", index_col=data_ns.TIME)
+        data = data.iloc[:, 0]
+        # pyarrow reads date only values as dates, not timestamps
+        data.index = pd.to_datetime(data.index)
         data.name = self.column
         return data
 
+    def _get_exo(self) -> Union[pd.Series, pd.DatetimeIndex]:
+        """
+        Returns parsed data source file. File is read once
+        and reused across transforms (e.g. backtesting windows).
+        """
+        key = (type(self), str(self.file.resolve()), self.file.stat().st_mtime)
+        if key not in self._cache:
+            # older versions of the same file are dropped
+            for stale in [k for k in self._cache if k[:2] == key[:2]]:
+                del self._cache[stale]
+            self._cache[key] = self._read_file()
+        return self._cache[key]
+
     def transform(self, X: pd.DataFrame) -> pd.DataFrame:
         """
         Transforms the input DataFrame by adding an new column,
@@ -246,11 +383,11 @@ class BaseFileProvider(BaseTransformer):
         ValueError
             If the DataFrame does not have a datetime index.
         """
-        df = X.copy()
-        if not isinstance(df.index, pd.DatetimeIndex):
+        if not isinstance(X.index, pd.DatetimeIndex):
             raise ValueError("DataFrame to transform should have datetime index")
-        exo = self._read_file()
-        df = self._transform(df, exo=exo)
+        exo = self._get_exo()
+        # _transform returns new DataFrame, input is not copied beforehand
+        df = self._transform(X, exo=exo)
         return df
 
     def _transform(self, X: pd.DataFrame, exo) -> pd.DataFrame:
@@ -271,12 +408,14 @@ class BaseFileProvider(BaseTransformer):
         pd.DataFrame
             Transformed input DataFrame.
         """
-        df = pd.merge(X, exo, how="left", left_index=True, right_index=True)
+        # exo values are aligned on exact timestamps, as with left join.
         # in case of less granular frequency or missing values, data is filled.
         # first fill next day, then bfill in case some days from beginning
         # are missing (data starts from not midnight time)
-        df[self.column] = df[self.column].ffill().fillna(method="bfill")
-        return df
+        aligned = exo.reindex(X.index).ffill()
+        if aligned.isna().any():
+            aligned = aligned.bfill()
+        return X.assign(**{self.column: aligned.to_numpy()})
 
 
 class FuelPricesProvider(BaseFileProvider):
@@ -322,16 +461,28 @@ class WeatherProvider(BaseFileProvider):
             files_ns.DATA_FOLDER, files_ns.CURATED_FOLDER, files_ns.WEATHER
         )
 
+    # weather file is parsed once for all weather features,
+    # keyed by file path and modification time
+    _frames: dict[tuple[str, float], pd.DataFrame] = {}
+
+    def _read_frame(self) -> pd.DataFrame:
+        """Returns all columns of weather file, shared by weather providers"""
+        key = (str(self.file.resolve()), self.file.stat().st_mtime)
+        if key not in self._frames:
+            # older versions of the same file are dropped
+            for stale in [k for k in self._frames if k[0] == key[0]]:
+                del self._frames[stale]
+            data = pd.read_csv(self.file, engine="pyarrow", index_col=data_ns.TIME)
+            data.index = pd.to_datetime(data.index)
+            self._frames[key] = data
+        return self._frames[key]
+
     def _read_file(self) -> pd.Series:
-        data = pd.read_csv(
-            self.file,
-            parse_dates=[data_ns.TIME],
-            index_col=data_ns.TIME,
-            usecols=[data_ns.TIME, self.column],
-        )
-        data = data.squeeze()
-        data.name = self.column
-        return data
+        return self._read_frame()[self.column]
+
+    def _get_exo(self) -> pd.Series:
+        """Returns column sliced from the shared weather frame, not cached again"""
+        return self._read_file()
 
 
 class TemperatureProvider(WeatherProvider):
@@ -360,18 +511,18 @@ class DayOffIndicatorCreator(BaseFileProvider):
     def _default_path(self) -> str:
         return os.path.join(files_ns.DATA_FOLDER, files_ns.HOLIDAYS)
 
-    def _read_file(self) -> list:
+    def _read_file(self) -> pd.DatetimeIndex:
         """
-        Reads the holiday file and returns a list of holiday dates.
+        Reads the holiday file and returns an index of holiday dates.
         Skips names of the holiday.
 
         Returns
         -------
-        list
-            A list of holiday dates.
+        pd.DatetimeIndex
+            An index of holiday dates (normalized to midnight).
         """
         data = super()._read_file()
-        return data.index.to_list()
+        return pd.DatetimeIndex(data.index).normalize()
 
     def _transform(self, X: pd.DataFrame, exo) -> pd.DataFrame:
         """
@@ -379,11 +530,6 @@ class DayOffIndicatorCreator(BaseFileProvider):
         Includes all holidays and weekends. By deafult includes all polish
         holidays from default holiday file.
         """
-        df = X.copy()
-        ind = map(
-            lambda x: x.replace(hour=0) in exo
-            or x.day_name() in {"Sunday", "Suturday"},
-            df.index,
-        )
-        df[self.column] = list(map(int, ind))
-        return df
+        is_holiday = X.index.normalize().isin(exo)
+        is_weekend = X.index.dayofweek >= 5
+        return X.assign(**{self.column: (is_holiday | is_weekend).astype(np.int8)})